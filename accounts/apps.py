@@ -1,6 +1,47 @@
+import os
+import sys
+
 from django.apps import AppConfig
 
 
 class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "accounts"
+
+    def ready(self):
+        # SENDGRID_API_KEY may live in AWS Secrets Manager instead of the env. Fetch it in the
+        # background and apply it to settings when it lands; nothing at boot waits on AWS.
+        from django.conf import settings
+
+        from peds_edu.aws_secrets import fetch_secret_async
+
+        if getattr(settings, "SENDGRID_API_KEY", ""):
+            return
+        if not _serves_requests():
+            return
+        future = fetch_secret_async("SendGrid_API", region_name="ap-south-1")
+        future.add_done_callback(_apply_sendgrid_secret)
+
+
+def _serves_requests() -> bool:
+    # migrate, collectstatic, shell, ... don't send email; sending looks the secret up itself.
+    if os.path.basename(sys.argv[0]) == "manage.py":
+        return sys.argv[1:2] == ["runserver"]
+    return True
+
+
+def _apply_sendgrid_secret(future) -> None:
+    from django.conf import settings
+
+    from .sendgrid_utils import _extract_sendgrid_key
+
+    try:
+        key = _extract_sendgrid_key(future.result() or "")
+    except Exception:
+        return
+    if not key:
+        return
+    if not getattr(settings, "SENDGRID_API_KEY", ""):
+        settings.SENDGRID_API_KEY = key
+    if not getattr(settings, "EMAIL_HOST_PASSWORD", ""):
+        settings.EMAIL_HOST_PASSWORD = key
@@ -5,6 +5,8 @@ from django import forms
 from django.contrib.auth.forms import AuthenticationForm, SetPasswordForm
 from django.core.validators import RegexValidator
 
+from .validators import PHONE_10_DIGITS, PIN_6_DIGITS
+
 
 class DoctorRegistrationForm(forms.Form):
     doctor_id = forms.CharField(
@@ -18,9 +20,7 @@ class DoctorRegistrationForm(forms.Form):
     whatsapp_number = forms.CharField(
         label="Doctor's WhatsApp number - 10 digits",
         required=True,
-        validators=[
-            RegexValidator(r"^\d{10}$", "Enter a 10-digit WhatsApp number (without country code)."),
-        ],
+        validators=[PHONE_10_DIGITS],
     )
 
     clinic_number = forms.CharField(
@@ -34,9 +34,7 @@ class DoctorRegistrationForm(forms.Form):
     clinic_whatsapp_number = forms.CharField(
         label="Clinic's appointment booking WhatsApp number - 10 digits",
         required=True,
-        validators=[
-            RegexValidator(r"^\d{10}$", "Enter a 10-digit WhatsApp number (without country code)."),
-        ],
+        validators=[PHONE_10_DIGITS],
     )
 
     imc_number = forms.CharField(
@@ -51,9 +49,7 @@ class DoctorRegistrationForm(forms.Form):
     postal_code = forms.CharField(
         label="Postal Code (6 digits)",
         required=True,
-        validators=[
-            RegexValidator(r"^\d{6}$", "Enter a valid 6-digit PIN code."),
-        ],
+        validators=[PIN_6_DIGITS],
     )
 
     address_text = forms.CharField(
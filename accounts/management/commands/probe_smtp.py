@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.sendgrid_utils import _probe_tcp, _smtp_host_port
+
+
+class Command(BaseCommand):
+    help = (
+        "Open a plain TCP connection to the configured SMTP server (EMAIL_HOST/EMAIL_PORT) "
+        "to check outbound connectivity. Sends no email."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="", help="Override EMAIL_HOST.")
+        parser.add_argument("--port", type=int, default=0, help="Override EMAIL_PORT.")
+        parser.add_argument("--timeout", type=float, default=3.0, help="Connect timeout in seconds (default: 3).")
+
+    def handle(self, *args, **options):
+        host, port = _smtp_host_port()
+        host = (options["host"] or "").strip() or host
+        port = options["port"] or port
+
+        result = _probe_tcp(host, port, timeout=options["timeout"])
+        if result != "tcp_ok":
+            raise CommandError(f"{host}:{port} -> {result}")
+
+        self.stdout.write(self.style.SUCCESS(f"{host}:{port} -> {result}"))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
 import html as html_lib
 import json
@@ -7,19 +8,53 @@ import os
 import smtplib
 import socket
 import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from email import policy as email_policy
 from email.message import EmailMessage
+from functools import cached_property, lru_cache
 from typing import Iterable, Optional, Tuple
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
+import urllib3
 from django.apps import apps
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connection
+from django.dispatch import receiver
 
-from peds_edu.aws_secrets import get_last_error, get_secret_string
+from peds_edu.aws_secrets import get_last_error, get_secret_strings
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
 SENDGRID_API_URL = "https://api.sendgrid.com/v3/mail/send"
 
+# Keep-alive connection pool for api.sendgrid.com, shared by every send in this process.
+# Retries stay off: the candidate loop below decides whether to try another key.
+_HTTP = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=16,
+    retries=False,
+    timeout=urllib3.Timeout(total=25),
+)
+
+# Background writer for EmailLog rows when settings.EMAIL_LOG_ASYNC is on; created on first use
+# and drained at interpreter exit so queued rows are not lost.
+_LOG_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_LOG_EXECUTOR_LOCK = threading.Lock()
+
+# Logged-in SMTP connection per worker thread, reused across sends (settings.SMTP_REUSE_CONNECTION).
+_SMTP_POOL = threading.local()
+
+# Bodies above this size never get the optional <pre> HTML part.
+_HTML_PART_MAX_CHARS = 64 * 1024
+
+# Resolved once per process by _get_backend_mode(); cleared by reset_backend_mode_cache().
+_BACKEND_MODE_CACHE: Optional[str] = None
+
 
 def _truncate(s: str, limit: int = 12000) -> str:
     s = s or ""
@@ -28,6 +63,22 @@ def _truncate(s: str, limit: int = 12000) -> str:
     return s[:limit] + f"\n... (truncated; len={len(s)})"
 
 
+def _json_bytes(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_extend(base_json: bytes, extra: dict) -> bytes:
+    """Append keys to an already serialized JSON object without re-encoding the base."""
+    extra_json = _json_bytes(extra)
+    if base_json == b"{}":
+        return extra_json
+    if extra_json == b"{}":
+        return base_json
+    return base_json[:-1] + b"," + extra_json[1:]
+
+
 def _sanitize_secret(s: str) -> str:
     s = (s or "").strip()
     if not s:
@@ -50,6 +101,10 @@ def _extract_sendgrid_key(raw: str) -> str:
     if not raw:
         return ""
 
+    # Fast path: SendGrid keys always start with "SG." and never contain whitespace.
+    if raw.startswith("SG.") and " " not in raw and "\n" not in raw:
+        return raw
+
     if raw.startswith("{") and raw.endswith("}"):
         try:
             obj = json.loads(raw)
@@ -91,6 +146,7 @@ def _redacted_tail(secret: str, n: int = 4) -> str:
     return secret[-n:]
 
 
+@lru_cache(maxsize=1)
 def _aws_region() -> str:
     return (
         os.getenv("AWS_REGION")
@@ -100,6 +156,7 @@ def _aws_region() -> str:
     )
 
 
+@lru_cache(maxsize=1)
 def _aws_secret_name() -> str:
     return (
         os.getenv("SENDGRID_SECRET_NAME")
@@ -108,18 +165,31 @@ def _aws_secret_name() -> str:
     )
 
 
-def _get_secret_string_uncached(secret_name: str, region_name: str) -> Tuple[str, Optional[str]]:
-    try:
-        wrapped = getattr(get_secret_string, "__wrapped__", None)
-        if wrapped is not None:
-            val = wrapped(secret_name, region_name=region_name)  # type: ignore[misc]
-        else:
-            val = get_secret_string(secret_name, region_name=region_name)
+@lru_cache(maxsize=1)
+def _aws_fallback_secret_names() -> tuple[str, ...]:
+    raw = os.getenv("SENDGRID_FALLBACK_SECRET_NAMES") or getattr(settings, "SENDGRID_FALLBACK_SECRET_NAMES", "") or ""
+    if isinstance(raw, (list, tuple)):
+        raw = ",".join(str(n) for n in raw)
+    return tuple(n.strip() for n in str(raw).split(",") if n.strip())
+
+
+def _get_secret_strings_cached(names: list[str], region_name: str) -> dict[str, tuple[str, Optional[str]]]:
+    """
+    Resolve several secrets as {name: (value, error)}.
 
-        err = (get_last_error() or "").strip()
-        return (val or "").strip(), (err or None)
+    Caching (including the short-lived cache of failures) lives in peds_edu.aws_secrets.
+    """
+    try:
+        found = get_secret_strings(names, region_name=region_name)
+        err = (get_last_error() or "").strip() or None
     except Exception as e:
-        return "", f"{type(e).__name__}: {e}"
+        found, err = {}, f"{type(e).__name__}: {e}"
+
+    out: dict[str, tuple[str, Optional[str]]] = {}
+    for name in names:
+        val = (found.get(name) or "").strip()
+        out[name] = (val, None if val else (err or "secret_not_found"))
+    return out
 
 
 @dataclass(frozen=True)
@@ -127,7 +197,7 @@ class _KeyCandidate:
     source: str
     key: str
 
-    @property
+    @cached_property
     def fp(self) -> str:
         return _fingerprint(self.key)
 
@@ -155,16 +225,22 @@ def _iter_sendgrid_api_key_candidates() -> Tuple[list[_KeyCandidate], dict]:
 
     candidates_raw: list[tuple[str, str]] = []
 
-    # AWS Secrets first
-    secret_raw, secret_err = _get_secret_string_uncached(secret_name, region)
+    # AWS Secrets first (primary + fallback secret names, resolved in one batch call)
+    secret_names = list(dict.fromkeys([secret_name, *_aws_fallback_secret_names()]))
+    secrets = _get_secret_strings_cached(secret_names, region)
+
+    secret_raw, secret_err = secrets.get(secret_name, ("", None))
     if secret_err:
         diag["aws_secret_error"] = secret_err
     if secret_raw:
         diag["aws_secret_value_present"] = True
+    if len(secret_names) > 1:
+        diag["fallback_secret_names"] = secret_names[1:]
 
-    secret_key = _extract_sendgrid_key(secret_raw)
-    if secret_key:
-        candidates_raw.append((f"aws_secrets:{secret_name}@{region}", secret_key))
+    for name in secret_names:
+        secret_key = _extract_sendgrid_key(secrets.get(name, ("", None))[0])
+        if secret_key:
+            candidates_raw.append((f"aws_secrets:{name}@{region}", secret_key))
 
     # Settings/env fallbacks
     candidates_raw.append(("settings.SENDGRID_API_KEY", str(getattr(settings, "SENDGRID_API_KEY", "") or "")))
@@ -173,36 +249,60 @@ def _iter_sendgrid_api_key_candidates() -> Tuple[list[_KeyCandidate], dict]:
     candidates_raw.append(("env:EMAIL_HOST_PASSWORD", os.getenv("EMAIL_HOST_PASSWORD", "") or ""))
 
     out: list[_KeyCandidate] = []
-    seen_fp: set[str] = set()
+    # Dedupe on the key itself; the sha256 fingerprint is only needed for logging.
+    seen: set[str] = set()
     for src, raw in candidates_raw:
         key = _extract_sendgrid_key(raw)
-        if not key:
-            continue
-        fp = _fingerprint(key)
-        if fp in seen_fp:
+        if not key or key in seen:
             continue
-        seen_fp.add(fp)
+        seen.add(key)
         out.append(_KeyCandidate(source=src, key=key))
 
     return out, diag
 
 
-def _resolve_from_email(from_email: Optional[str] = None) -> str:
-    if from_email and str(from_email).strip():
-        return str(from_email).strip()
+@lru_cache(maxsize=1)
+def _default_from_email() -> str:
     v = getattr(settings, "SENDGRID_FROM_EMAIL", None) or getattr(settings, "DEFAULT_FROM_EMAIL", None)
     if v and str(v).strip():
         return str(v).strip()
     return "no-reply@example.com"
 
 
+def _resolve_from_email(from_email: Optional[str] = None) -> str:
+    if from_email and str(from_email).strip():
+        return str(from_email).strip()
+    return _default_from_email()
+
+
+def reset_backend_mode_cache() -> None:
+    global _BACKEND_MODE_CACHE
+    _BACKEND_MODE_CACHE = None
+
+
+@receiver(setting_changed)
+def _reset_settings_caches(*, setting: str, **kwargs) -> None:
+    # Settings are fixed at runtime; this only fires under override_settings() in tests.
+    _aws_region.cache_clear()
+    _aws_secret_name.cache_clear()
+    _aws_fallback_secret_names.cache_clear()
+    _default_from_email.cache_clear()
+    reset_backend_mode_cache()
+
+
 def _get_backend_mode() -> str:
+    global _BACKEND_MODE_CACHE
+    if _BACKEND_MODE_CACHE is not None:
+        return _BACKEND_MODE_CACHE
+
     v = str(getattr(settings, "EMAIL_BACKEND_MODE", "") or "").strip().lower()
     if v in ("sendgrid", "smtp", "console"):
+        _BACKEND_MODE_CACHE = v
         return v
     # Default: if we have any key candidate, prefer sendgrid API
     cands, _ = _iter_sendgrid_api_key_candidates()
-    return "sendgrid" if cands else "smtp"
+    _BACKEND_MODE_CACHE = "sendgrid" if cands else "smtp"
+    return _BACKEND_MODE_CACHE
 
 
 def _probe_tcp(host: str, port: int, timeout: float = 3.0) -> str:
@@ -213,7 +313,18 @@ def _probe_tcp(host: str, port: int, timeout: float = 3.0) -> str:
         return f"tcp_fail:{type(e).__name__}"
 
 
-def _log_email_attempt(
+def _smtp_probe_enabled() -> bool:
+    # The pre-send probe doubles the TCP handshake; only run it when troubleshooting.
+    return os.getenv("SMTP_PROBE", "0") == "1"
+
+
+def _smtp_host_port() -> Tuple[str, int]:
+    host = str(getattr(settings, "EMAIL_HOST", "") or "smtp.sendgrid.net").strip()
+    port = int(getattr(settings, "EMAIL_PORT", 587) or 587)
+    return host, port
+
+
+def _build_email_log(
     *,
     to_email: str,
     subject: str,
@@ -222,28 +333,63 @@ def _log_email_attempt(
     status_code: Optional[int] = None,
     response_body: str = "",
     error: str = "",
-) -> None:
+):
+    """Return an unsaved EmailLog row, or None when the model is unavailable."""
     try:
         EmailLog = apps.get_model("accounts", "EmailLog")
     except Exception:
-        EmailLog = None
+        return None
+
+    return EmailLog(
+        to_email=to_email,
+        subject=subject,
+        provider=provider,
+        success=bool(success),
+        status_code=status_code,
+        response_body=_truncate(response_body or ""),
+        error=_truncate(error or "", limit=8000),
+    )
 
-    if EmailLog is None:
-        return
 
+def _bulk_create_email_logs(logs: list) -> None:
     try:
-        EmailLog.objects.create(
-            to_email=to_email,
-            subject=subject,
-            provider=provider,
-            success=bool(success),
-            status_code=status_code,
-            response_body=_truncate(response_body or ""),
-            error=_truncate(error or "", limit=8000),
-        )
+        type(logs[0]).objects.bulk_create(logs, batch_size=500, ignore_conflicts=True)
     except Exception:
+        # Logging must never break a send.
+        return
+
+
+def _write_email_logs_in_background(logs: list) -> None:
+    try:
+        _bulk_create_email_logs(logs)
+    finally:
+        # Worker threads get their own DB connection; release it once the write is done.
+        connection.close()
+
+
+def _get_log_executor() -> ThreadPoolExecutor:
+    global _LOG_EXECUTOR
+    with _LOG_EXECUTOR_LOCK:
+        if _LOG_EXECUTOR is None:
+            _LOG_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="email-log")
+            atexit.register(_LOG_EXECUTOR.shutdown, wait=True)
+        return _LOG_EXECUTOR
+
+
+def _save_email_logs(logs: list) -> None:
+    logs = [log for log in logs if log is not None]
+    if not logs:
         return
 
+    if getattr(settings, "EMAIL_LOG_ASYNC", False):
+        try:
+            _get_log_executor().submit(_write_email_logs_in_background, logs)
+            return
+        except Exception:
+            pass
+
+    _bulk_create_email_logs(logs)
+
 
 def _send_via_sendgrid_api(
     *,
@@ -251,6 +397,7 @@ def _send_via_sendgrid_api(
     to_emails: list[str],
     plain_text: str,
     from_email: str,
+    include_html: bool = False,
 ) -> Tuple[bool, Optional[int], str, str]:
     candidates, aws_diag = _iter_sendgrid_api_key_candidates()
 
@@ -264,21 +411,26 @@ def _send_via_sendgrid_api(
         "authorization_header_set": True,
     }
 
+    diag_base_json = _json_bytes(diag_base)
+
     if not candidates:
-        return False, None, json.dumps(diag_base), "No SendGrid API key candidates found"
+        return False, None, diag_base_json.decode("utf-8"), "No SendGrid API key candidates found"
 
-    safe_html = "<pre>" + html_lib.escape(plain_text or "") + "</pre>"
+    content = [{"type": "text/plain", "value": plain_text or ""}]
+    # Very large bodies always go out as plain text only.
+    if include_html and len(plain_text or "") <= _HTML_PART_MAX_CHARS:
+        safe_html = "<pre>" + html_lib.escape(plain_text or "", quote=False) + "</pre>"
+        content.append({"type": "text/html", "value": safe_html})
 
     payload = {
-        "personalizations": [{"to": [{"email": e} for e in to_emails]}],
+        # One personalization per recipient: SendGrid fans the message out server-side from this
+        # single request, and recipients do not see each other's addresses.
+        "personalizations": [{"to": [{"email": e}]} for e in to_emails],
         "from": {"email": from_email},
         "subject": subject,
-        "content": [
-            {"type": "text/plain", "value": plain_text or ""},
-            {"type": "text/html", "value": safe_html},
-        ],
+        "content": content,
     }
-    payload_bytes = json.dumps(payload).encode("utf-8")
+    payload_bytes = _json_bytes(payload)
 
     last_status: Optional[int] = None
     last_err_text: str = ""
@@ -292,32 +444,28 @@ def _send_via_sendgrid_api(
         }
 
         try:
-            req = Request(SENDGRID_API_URL, data=payload_bytes, headers=headers, method="POST")
-            with urlopen(req, timeout=25) as resp:
-                status = getattr(resp, "status", None) or resp.getcode()
-                body = resp.read().decode("utf-8", errors="ignore") if resp else ""
+            resp = _HTTP.request("POST", SENDGRID_API_URL, body=payload_bytes, headers=headers)
+            status = resp.status
+            body = resp.data.decode("utf-8", errors="ignore") if resp.data else ""
 
             ok = isinstance(status, int) and 200 <= status < 300
 
-            diag = dict(diag_base)
-            diag.update(
-                {
-                    "selected_source": cand.source,
-                    "sendgrid_api_key_fp": cand.fp,
-                    "sendgrid_api_key_tail": cand.tail,
-                    "status_code": status,
-                }
-            )
-
-            combined = json.dumps(diag)
-            if body:
-                combined += "\n" + _truncate(body, 12000)
-
             if ok:
+                combined = _json_extend(
+                    diag_base_json,
+                    {
+                        "selected_source": cand.source,
+                        "sendgrid_api_key_fp": cand.fp,
+                        "sendgrid_api_key_tail": cand.tail,
+                        "status_code": status,
+                    },
+                ).decode("utf-8")
+                if body:
+                    combined += "\n" + _truncate(body, 12000)
                 return True, int(status), combined, ""
 
             last_status = int(status) if isinstance(status, int) else None
-            last_err_text = f"HTTP {status}"
+            last_err_text = f"HTTPError {status}" if isinstance(status, int) and status >= 400 else f"HTTP {status}"
             last_err_body = body
 
             if status in (401, 403):
@@ -325,20 +473,7 @@ def _send_via_sendgrid_api(
 
             break
 
-        except HTTPError as e:
-            status = getattr(e, "code", None)
-            body = ""
-            try:
-                body = e.read().decode("utf-8", errors="ignore")  # type: ignore[attr-defined]
-            except Exception:
-                pass
-            last_status = int(status) if isinstance(status, int) else None
-            last_err_text = f"HTTPError {status}"
-            last_err_body = body
-            if status in (401, 403):
-                continue
-            break
-        except URLError as e:
+        except urllib3.exceptions.HTTPError as e:
             last_status = None
             last_err_text = f"URLError: {e}"
             break
@@ -347,14 +482,88 @@ def _send_via_sendgrid_api(
             last_err_text = f"{type(e).__name__}: {e}"
             break
 
-    diag = dict(diag_base)
-    diag.update({"selected_source": None, "last_status": last_status, "last_error": _truncate(last_err_text, 2000)})
-    combined = json.dumps(diag)
+    combined = _json_extend(
+        diag_base_json,
+        {"selected_source": None, "last_status": last_status, "last_error": _truncate(last_err_text, 2000)},
+    ).decode("utf-8")
     if last_err_body:
         combined += "\n" + _truncate(last_err_body, 12000)
     return False, last_status, combined, last_err_text or "SendGrid API send failed"
 
 
+def _smtp_reuse_enabled() -> bool:
+    return bool(getattr(settings, "SMTP_REUSE_CONNECTION", True))
+
+
+def _smtp_connect(host: str, port: int, use_tls: bool, use_ssl: bool, user: str, pw: str) -> smtplib.SMTP:
+    if use_ssl:
+        server: smtplib.SMTP = smtplib.SMTP_SSL(host=host, port=port, timeout=20)
+    else:
+        server = smtplib.SMTP(host=host, port=port, timeout=20)
+
+    try:
+        server.ehlo()
+        if use_tls and not use_ssl:
+            ctx = ssl.create_default_context()
+            server.starttls(context=ctx)
+            server.ehlo()
+        server.login(user, pw)
+    except Exception:
+        _smtp_close(server)
+        raise
+    return server
+
+
+def _smtp_close(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except Exception:
+        pass
+    try:
+        server.close()
+    except Exception:
+        pass
+
+
+def _get_smtp(host: str, port: int, use_tls: bool, use_ssl: bool, user: str, pw: str) -> Tuple[smtplib.SMTP, bool]:
+    """Return this thread's logged-in SMTP connection, (re)connecting when needed; second item is True if reused."""
+    key = (host, port, use_tls, use_ssl, user, pw)
+    conn = getattr(_SMTP_POOL, "conn", None)
+    if conn is not None:
+        if getattr(_SMTP_POOL, "key", None) == key:
+            try:
+                if conn.noop()[0] == 250:
+                    return conn, True
+            except Exception:
+                pass
+        close_smtp_pool()
+
+    conn = _smtp_connect(host, port, use_tls, use_ssl, user, pw)
+    _SMTP_POOL.conn = conn
+    _SMTP_POOL.key = key
+    return conn, False
+
+
+def close_smtp_pool() -> None:
+    """Close this thread's pooled SMTP connection, if any."""
+    conn = getattr(_SMTP_POOL, "conn", None)
+    _SMTP_POOL.conn = None
+    _SMTP_POOL.key = None
+    if conn is not None:
+        _smtp_close(conn)
+
+
+def _render_message_bytes(subject: str, from_email: str, to_emails: list[str], plain_text: str) -> bytes:
+    """Encode the message once; the bytes are reused if the send has to reconnect and retry."""
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"] = from_email
+    msg["To"] = ", ".join(to_emails)
+    msg.set_content(plain_text or "")
+    # sendmail() sends bytes as-is, so render with CRLF line endings like send_message() does.
+    return msg.as_bytes(policy=email_policy.SMTP)
+
+
 def _send_via_smtp(
     *,
     subject: str,
@@ -362,14 +571,13 @@ def _send_via_smtp(
     plain_text: str,
     from_email: str,
 ) -> Tuple[bool, Optional[int], str, str]:
-    host = str(getattr(settings, "EMAIL_HOST", "") or "smtp.sendgrid.net").strip()
-    port = int(getattr(settings, "EMAIL_PORT", 587) or 587)
+    host, port = _smtp_host_port()
     use_tls = bool(getattr(settings, "EMAIL_USE_TLS", True))
     use_ssl = bool(getattr(settings, "EMAIL_USE_SSL", False))
     user = str(getattr(settings, "EMAIL_HOST_USER", "apikey") or "apikey").strip()
 
     candidates, aws_diag = _iter_sendgrid_api_key_candidates()
-    probe = _probe_tcp(host, port)
+    probe = _probe_tcp(host, port) if _smtp_probe_enabled() else "skipped"
 
     # Prefer EMAIL_HOST_PASSWORD, but allow SendGrid candidates as SMTP password
     pw = _sanitize_secret(str(getattr(settings, "EMAIL_HOST_PASSWORD", "") or ""))
@@ -390,35 +598,27 @@ def _send_via_smtp(
         }
         return False, None, json.dumps(diag), "No SMTP password available"
 
-    msg = EmailMessage()
-    msg["Subject"] = subject
-    msg["From"] = from_email
-    msg["To"] = ", ".join(to_emails)
-    msg.set_content(plain_text or "")
+    msg_bytes = _render_message_bytes(subject, from_email, to_emails, plain_text)
 
-    try:
-        if use_ssl:
-            server: smtplib.SMTP = smtplib.SMTP_SSL(host=host, port=port, timeout=20)
-        else:
-            server = smtplib.SMTP(host=host, port=port, timeout=20)
+    conn_args = (host, port, use_tls, use_ssl, user, pw)
+    reused = False
 
-        try:
-            server.ehlo()
-            if use_tls and not use_ssl:
-                ctx = ssl.create_default_context()
-                server.starttls(context=ctx)
-                server.ehlo()
-            server.login(user, pw)
-            server.send_message(msg)
+    try:
+        if _smtp_reuse_enabled():
             try:
-                server.quit()
-            except Exception:
-                pass
-        finally:
+                server, reused = _get_smtp(*conn_args)
+                server.sendmail(from_email, to_emails, msg_bytes)
+            except smtplib.SMTPServerDisconnected:
+                # The pooled connection went away between NOOP and send; reconnect once.
+                close_smtp_pool()
+                server, reused = _get_smtp(*conn_args)
+                server.sendmail(from_email, to_emails, msg_bytes)
+        else:
+            server = _smtp_connect(*conn_args)
             try:
-                server.close()
-            except Exception:
-                pass
+                server.sendmail(from_email, to_emails, msg_bytes)
+            finally:
+                _smtp_close(server)
 
         diag = {
             "provider": "smtp",
@@ -430,10 +630,13 @@ def _send_via_smtp(
             "smtp_user": user,
             "smtp_password_source": pw_src,
             "smtp_password_tail": _redacted_tail(pw, 4),
+            "smtp_reused_connection": reused,
             "aws_secrets": aws_diag,
         }
         return True, 250, json.dumps(diag), ""
     except Exception as e:
+        if _smtp_reuse_enabled():
+            close_smtp_pool()
         diag = {
             "provider": "smtp",
             "host": host,
@@ -453,22 +656,27 @@ def send_email_via_sendgrid(
     to_emails: Iterable[str],
     plain_text_content: str,
     from_email: Optional[str] = None,
+    include_html: bool = False,
 ) -> bool:
     subject = (subject or "").strip()
     recipients = [str(e).strip() for e in (to_emails or []) if e and str(e).strip()]
     recipients = list(dict.fromkeys(recipients))
 
     if not subject or not recipients:
-        for r in recipients or [""]:
-            _log_email_attempt(
-                to_email=r or "(missing)",
-                subject=subject or "(missing)",
-                provider="internal",
-                success=False,
-                status_code=None,
-                response_body="",
-                error="Missing subject and/or recipients",
-            )
+        _save_email_logs(
+            [
+                _build_email_log(
+                    to_email=r or "(missing)",
+                    subject=subject or "(missing)",
+                    provider="internal",
+                    success=False,
+                    status_code=None,
+                    response_body="",
+                    error="Missing subject and/or recipients",
+                )
+                for r in recipients or [""]
+            ]
+        )
         return False
 
     mode = _get_backend_mode()
@@ -476,34 +684,45 @@ def send_email_via_sendgrid(
 
     providers = ["smtp", "sendgrid"] if mode == "smtp" else ["sendgrid", "smtp"]
 
-    for provider in providers:
-        if provider == "sendgrid":
-            ok, status, resp_body, err = _send_via_sendgrid_api(
-                subject=subject,
-                to_emails=recipients,
-                plain_text=plain_text_content or "",
-                from_email=from_addr,
-            )
-        else:
-            ok, status, resp_body, err = _send_via_smtp(
-                subject=subject,
-                to_emails=recipients,
-                plain_text=plain_text_content or "",
-                from_email=from_addr,
-            )
-
-        for r in recipients:
-            _log_email_attempt(
-                to_email=r,
-                subject=subject,
-                provider=provider,
-                success=ok,
-                status_code=status,
-                response_body=resp_body,
-                error=err,
-            )
-
-        if ok:
-            return True
-
-    return False
+    # One EmailLog row per recipient per provider attempt, written in a single INSERT.
+    logs: list = []
+    try:
+        for provider in providers:
+            if provider == "sendgrid":
+                ok, status, resp_body, err = _send_via_sendgrid_api(
+                    subject=subject,
+                    to_emails=recipients,
+                    plain_text=plain_text_content or "",
+                    from_email=from_addr,
+                    include_html=include_html,
+                )
+            else:
+                ok, status, resp_body, err = _send_via_smtp(
+                    subject=subject,
+                    to_emails=recipients,
+                    plain_text=plain_text_content or "",
+                    from_email=from_addr,
+                )
+
+            # The diagnostics are identical for every recipient of an attempt: store them on the
+            # first recipient's row only and point the others at it.
+            shared_body_ref = f"(see {provider} log for {recipients[0]} in this attempt)" if resp_body else ""
+            for i, r in enumerate(recipients):
+                logs.append(
+                    _build_email_log(
+                        to_email=r,
+                        subject=subject,
+                        provider=provider,
+                        success=ok,
+                        status_code=status,
+                        response_body=resp_body if i == 0 else shared_body_ref,
+                        error=err,
+                    )
+                )
+
+            if ok:
+                return True
+
+        return False
+    finally:
+        _save_email_logs(logs)
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from django.core.validators import RegexValidator
+
+# Shared validator instances so the same pattern is compiled and configured once.
+PHONE_10_DIGITS = RegexValidator(r"^\d{10}$", "Enter a 10-digit WhatsApp number (without country code).")
+PIN_6_DIGITS = RegexValidator(r"^\d{6}$", "Enter a valid 6-digit PIN code.")
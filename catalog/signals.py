@@ -1,4 +1,5 @@
 from django.core.cache import cache
+from django.db import transaction
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
@@ -8,16 +9,20 @@ from .models import (
     TriggerCluster,
     Video,
     VideoCluster,
+    VideoClusterLanguage,
     VideoClusterVideo,
+    VideoLanguage,
     VideoTriggerMap,
 )
 
 # IMPORTANT:
-# Share page uses clinic_catalog_payload_v6 (previously v5).
+# Share page uses clinic_catalog_payload_v8 (see sharing.services._CATALOG_CACHE_KEY).
 # Old signal only deleted catalog_json_v1, causing stale payloads.
 CATALOG_CACHE_KEYS = [
     "clinic_catalog_payload_v5",
     "clinic_catalog_payload_v6",
+    "clinic_catalog_payload_v7",
+    "clinic_catalog_payload_v8",
 ]
 
 
@@ -32,6 +37,14 @@ def clear_catalog_cache() -> None:
         except Exception:
             pass
 
+    # Also drop this process's in-memory copy (other workers expire theirs by TTL).
+    try:
+        from sharing.services import clear_local_catalog_cache
+
+        clear_local_catalog_cache()
+    except Exception:
+        pass
+
 
 @receiver(post_save, sender=TherapyArea)
 @receiver(post_delete, sender=TherapyArea)
@@ -47,5 +60,11 @@ def clear_catalog_cache() -> None:
 @receiver(post_delete, sender=VideoClusterVideo)
 @receiver(post_save, sender=VideoTriggerMap)
 @receiver(post_delete, sender=VideoTriggerMap)
+@receiver(post_save, sender=VideoLanguage)
+@receiver(post_delete, sender=VideoLanguage)
+@receiver(post_save, sender=VideoClusterLanguage)
+@receiver(post_delete, sender=VideoClusterLanguage)
 def _on_catalog_change(*args, **kwargs):
-    clear_catalog_cache()
+    # Clear after commit: clearing inside the transaction lets a concurrent request
+    # re-cache the pre-edit rows. Outside a transaction this runs immediately.
+    transaction.on_commit(clear_catalog_cache)
@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import base64
 import os
-from functools import lru_cache
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
+from cachetools import TTLCache
+
 try:
     import boto3
+    from botocore.config import Config as BotoConfig
     from botocore.exceptions import (
         BotoCoreError,
         ClientError,
@@ -19,6 +23,7 @@ except Exception as e:  # pragma: no cover
     # Keep this extremely lightweight; do not crash import-time.
     print("[DEBUG] boto3 import failed:", repr(e))
     boto3 = None  # type: ignore
+    BotoConfig = None  # type: ignore
     BotoCoreError = Exception  # type: ignore
     ClientError = Exception  # type: ignore
     EndpointConnectionError = Exception  # type: ignore
@@ -29,24 +34,91 @@ except Exception as e:  # pragma: no cover
 
 _LAST_ERROR: str = ""
 
+# Background fetches started by fetch_secret_async(), keyed by (secret_name, region_name).
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_PENDING: dict[tuple[str, str], Future] = {}
+_PENDING_LOCK = threading.Lock()
+
+# One Secrets Manager client per region for the life of the process; building a session/client
+# (credential chain, endpoint resolution, signer) is the expensive part of a cache miss.
+_CLIENTS: dict = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Resolved secrets, keyed by (secret_name, region_name). The only secret cache in the project:
+# get_secret_string() and get_secret_strings() both read and fill it, and entries expire so
+# rotated secrets are picked up without a restart.
+# Failures are remembered only briefly so a bad boot-time fetch is retried soon.
+_SECRET_CACHE: TTLCache = TTLCache(maxsize=32, ttl=900)
+_SECRET_ERRORS: TTLCache = TTLCache(maxsize=32, ttl=30)
+_SECRET_CACHE_LOCK = threading.Lock()
+
+# Regions where batch_get_secret_value is unavailable to us (AccessDenied or an old botocore);
+# later lookups there go straight to per-secret get_secret_value calls.
+_BATCH_UNAVAILABLE: set[str] = set()
+
 
 def _debug_enabled() -> bool:
     # Enable with DEBUG_AWS_SECRETS=1
     return os.getenv("DEBUG_AWS_SECRETS", "0") == "1"
 
 
+def _get_client(region_name: str):
+    client = _CLIENTS.get(region_name)
+    if client is not None:
+        return client
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(region_name)
+        if client is None:
+            if _debug_enabled():
+                print(f"[DEBUG] Creating Secrets Manager client | region={region_name}")
+            client = boto3.session.Session().client(
+                service_name="secretsmanager",
+                region_name=region_name,
+                config=BotoConfig(
+                    tcp_keepalive=True,
+                    max_pool_connections=4,
+                    retries={"max_attempts": 2, "mode": "standard"},
+                    connect_timeout=2,
+                    read_timeout=3,
+                ),
+            )
+            _CLIENTS[region_name] = client
+        return client
+
+
 def get_last_error() -> str:
     """Best-effort last error string from the most recent Secrets Manager call in this process."""
     return _LAST_ERROR
 
 
-@lru_cache(maxsize=32)
 def get_secret_string(secret_name: str, region_name: str = "ap-south-1") -> Optional[str]:
     """
     Fetch a secret string from AWS Secrets Manager.
 
+    Secrets already returned by get_secret_strings() are served without another AWS call.
     Best-effort: never raises.
     """
+    global _LAST_ERROR
+    key = (secret_name, region_name)
+    with _SECRET_CACHE_LOCK:
+        hit = _SECRET_CACHE.get(key)
+        err = _SECRET_ERRORS.get(key)
+    if hit:
+        return hit
+    if err:
+        _LAST_ERROR = err
+        return None
+
+    val = _fetch_secret_string(secret_name, region_name)
+    with _SECRET_CACHE_LOCK:
+        if val:
+            _SECRET_CACHE[key] = val
+        else:
+            _SECRET_ERRORS[key] = _LAST_ERROR or "secret_not_found"
+    return val
+
+
+def _fetch_secret_string(secret_name: str, region_name: str) -> Optional[str]:
     global _LAST_ERROR
     _LAST_ERROR = ""
 
@@ -60,13 +132,7 @@ def get_secret_string(secret_name: str, region_name: str = "ap-south-1") -> Opti
         return None
 
     try:
-        if _debug_enabled():
-            print("[DEBUG] Creating boto3 session")
-        session = boto3.session.Session()
-
-        if _debug_enabled():
-            print("[DEBUG] Creating Secrets Manager client")
-        client = session.client(service_name="secretsmanager", region_name=region_name)
+        client = _get_client(region_name)
 
         if _debug_enabled():
             print("[DEBUG] Calling get_secret_value")
@@ -116,3 +182,178 @@ def get_secret_string(secret_name: str, region_name: str = "ap-south-1") -> Opti
     if _debug_enabled():
         print("[DEBUG] No SecretString or SecretBinary found in response")
     return None
+
+
+def fetch_secret_async(secret_name: str, region_name: str = "ap-south-1") -> Future:
+    """
+    Start get_secret_string() on a background thread and return its Future.
+
+    The result also lands in the secret cache, so later synchronous calls are free.
+    Repeated calls for the same secret share one Future.
+    """
+    global _EXECUTOR
+    key = (secret_name, region_name)
+    with _PENDING_LOCK:
+        fut = _PENDING.get(key)
+        if fut is None:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aws-secrets")
+            fut = _EXECUTOR.submit(get_secret_string, secret_name, region_name)
+            _PENDING[key] = fut
+        return fut
+
+
+def _secret_value_from_response(item: dict) -> Optional[str]:
+    if item.get("SecretString"):
+        return str(item["SecretString"]).strip()
+    if item.get("SecretBinary"):
+        return base64.b64decode(item["SecretBinary"]).decode("utf-8").strip()
+    return None
+
+
+def _get_secret_strings_one_by_one(secret_names: list[str], region_name: str) -> dict[str, str]:
+    global _LAST_ERROR
+    out: dict[str, str] = {}
+    errors: list[str] = []
+    for name in secret_names:
+        val = _fetch_secret_string(name, region_name)
+        if val:
+            out[name] = val
+        elif _LAST_ERROR:
+            errors.append(f"{name}: {_LAST_ERROR}")
+    _LAST_ERROR = "; ".join(errors)
+    return out
+
+
+def get_secret_strings(secret_names: list[str], region_name: str = "ap-south-1") -> dict[str, str]:
+    """
+    Fetch several secrets with a single batch_get_secret_value call.
+
+    Returns {secret_name: secret_string} for the secrets that resolved; missing or
+    undecodable secrets are left out and reported via get_last_error().
+    Names already in the secret cache (or that failed within the last 30s) are
+    answered from it; only the rest go to AWS. A single name, or a region where the
+    batch API was denied before, uses plain get_secret_value calls instead.
+    Best-effort: never raises.
+    """
+    global _LAST_ERROR
+    _LAST_ERROR = ""
+
+    names = [n for n in dict.fromkeys(secret_names or []) if n]
+    if not names:
+        return {}
+
+    out: dict[str, str] = {}
+    errors: list[str] = []
+    misses: list[str] = []
+    with _SECRET_CACHE_LOCK:
+        for name in names:
+            key = (name, region_name)
+            hit = _SECRET_CACHE.get(key)
+            err = _SECRET_ERRORS.get(key)
+            if hit:
+                out[name] = hit
+            elif err:
+                if err not in errors:
+                    errors.append(err)
+            else:
+                misses.append(name)
+
+    if misses:
+        fetched = _fetch_secret_strings(misses, region_name)
+        fetch_err = _LAST_ERROR
+        with _SECRET_CACHE_LOCK:
+            for name in misses:
+                if name in fetched:
+                    _SECRET_CACHE[(name, region_name)] = fetched[name]
+                else:
+                    _SECRET_ERRORS[(name, region_name)] = fetch_err or "secret_not_found"
+        out.update(fetched)
+        if fetch_err:
+            errors.append(fetch_err)
+
+    _LAST_ERROR = "; ".join(errors)
+    return out
+
+
+def _fetch_secret_strings(names: list[str], region_name: str) -> dict[str, str]:
+    global _LAST_ERROR
+    _LAST_ERROR = ""
+
+    if _debug_enabled():
+        print(f"[DEBUG] get_secret_strings called | secret_names={names} | region={region_name}")
+
+    if boto3 is None:
+        _LAST_ERROR = "boto3_unavailable"
+        return {}
+
+    # A batch call only pays off for several names, and is a wasted round trip where it is denied.
+    if len(names) == 1 or region_name in _BATCH_UNAVAILABLE:
+        return _get_secret_strings_one_by_one(names, region_name)
+
+    out: dict[str, str] = {}
+    errors: list[str] = []
+    try:
+        client = _get_client(region_name)
+        kwargs: dict = {"SecretIdList": names}
+        while True:
+            response = client.batch_get_secret_value(**kwargs)
+            for item in response.get("SecretValues") or []:
+                name = item.get("Name") if item.get("Name") in names else item.get("ARN")
+                if name not in names:
+                    continue
+                try:
+                    val = _secret_value_from_response(item)
+                except Exception as e:
+                    errors.append(f"{name}: decode_error:{type(e).__name__}: {e}")
+                    continue
+                if val:
+                    out[name] = val
+            for err in response.get("Errors") or []:
+                errors.append(f"{err.get('SecretId')}: {err.get('ErrorCode')}: {err.get('Message')}")
+            token = response.get("NextToken")
+            if not token:
+                break
+            kwargs["NextToken"] = token
+
+    except ClientError as e:
+        code = ""
+        try:
+            code = e.response["Error"]["Code"]  # type: ignore[attr-defined]
+        except Exception:
+            pass
+        if code == "AccessDeniedException":
+            if _debug_enabled():
+                print("[DEBUG] batch_get_secret_value denied, falling back to per-secret calls")
+            _BATCH_UNAVAILABLE.add(region_name)
+            return _get_secret_strings_one_by_one(names, region_name)
+        _LAST_ERROR = f"{type(e).__name__}: {e}"
+        return {}
+
+    except AttributeError:
+        # botocore without batch_get_secret_value
+        _BATCH_UNAVAILABLE.add(region_name)
+        return _get_secret_strings_one_by_one(names, region_name)
+
+    except (
+        NoCredentialsError,
+        PartialCredentialsError,
+        NoRegionError,
+        EndpointConnectionError,
+        BotoCoreError,
+    ) as e:
+        _LAST_ERROR = f"{type(e).__name__}: {e}"
+        if _debug_enabled():
+            print("[DEBUG] AWS error while batch fetching secrets")
+            print("[DEBUG] Error:", _LAST_ERROR)
+        return {}
+
+    except Exception as e:
+        _LAST_ERROR = f"{type(e).__name__}: {e}"
+        if _debug_enabled():
+            print("[DEBUG] Unexpected error while batch fetching secrets")
+            print("[DEBUG] Error:", _LAST_ERROR)
+        return {}
+
+    _LAST_ERROR = "; ".join(errors)
+    return out
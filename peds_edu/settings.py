@@ -6,14 +6,11 @@ Configuration is done primarily via environment variables.
 
 from __future__ import annotations
 
-import json
 import os
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-from .aws_secrets import get_secret_string  # Optional fallback for secrets
-
 BASE_DIR = Path(__file__).resolve().parent.parent
 load_dotenv(BASE_DIR / ".env")
 
@@ -28,7 +25,7 @@ def env(name: str, default: str | None = None) -> str:
 SECRET_KEY = env("DJANGO_SECRET_KEY", "dev-insecure-change-me")
 DEBUG = env("DJANGO_DEBUG", "1") == "1"
 
-ALLOWED_HOSTS = [h.strip() for h in env("ALLOWED_HOSTS", "*").split(",") if h.strip()]
+ALLOWED_HOSTS = [h for h in (part.strip() for part in env("ALLOWED_HOSTS", "*").split(",")) if h]
 
 INSTALLED_APPS = [
     "django.contrib.admin",
@@ -139,46 +136,9 @@ SITE_BASE_URL = APP_BASE_URL
 
 # ---------------- EMAIL / SENDGRID ----------------
 
-def _extract_sendgrid_key_from_secret(secret_raw: str) -> str:
-    """
-    Your AWS secret may be:
-      - raw key string "SG...."
-      - JSON string like {"SendGrid_email":"SG...."} (your sample)
-      - JSON string like {"SENDGRID_API_KEY":"SG...."} or other variants
-    """
-    raw = (secret_raw or "").strip()
-    if not raw:
-        return ""
-
-    if raw.startswith("{") and raw.endswith("}"):
-        try:
-            obj = json.loads(raw)
-            if isinstance(obj, dict):
-                # Support your sample key name plus other common ones
-                for k in (
-                    "SendGrid_email",
-                    "sendgrid_email",
-                    "SENDGRID_API_KEY",
-                    "sendgrid_api_key",
-                    "api_key",
-                    "apikey",
-                    "key",
-                ):
-                    v = obj.get(k)
-                    if isinstance(v, str) and v.strip():
-                        return v.strip()
-        except Exception:
-            # If JSON parse fails, fall back to treating it as raw key
-            pass
-
-    return raw
-
-
+# Without SENDGRID_API_KEY in the env, AccountsConfig.ready() fetches it from AWS Secrets
+# Manager in the background; settings import never waits on AWS.
 SENDGRID_API_KEY = env("SENDGRID_API_KEY", "").strip()
-if not SENDGRID_API_KEY:
-    # Optional fallback via AWS Secrets Manager
-    secret_raw = (get_secret_string("SendGrid_API", region_name="ap-south-1") or "").strip()
-    SENDGRID_API_KEY = _extract_sendgrid_key_from_secret(secret_raw)
 
 SENDGRID_FROM_EMAIL = env("SENDGRID_FROM_EMAIL", "products@inditech.co.in").strip()
 EMAIL_BACKEND_MODE = env("EMAIL_BACKEND_MODE", "smtp").strip().lower()
@@ -196,6 +156,12 @@ EMAIL_HOST_USER = env("EMAIL_HOST_USER", "apikey")
 EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD", SENDGRID_API_KEY)
 DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL", SENDGRID_FROM_EMAIL)
 
+# Write EmailLog rows from a background thread instead of the request thread
+EMAIL_LOG_ASYNC = env("EMAIL_LOG_ASYNC", "0") == "1"
+
+# Keep one authenticated SMTP connection per worker thread instead of connecting per email
+SMTP_REUSE_CONNECTION = env("SMTP_REUSE_CONNECTION", "1") == "1"
+
 # ---------------- CACHE ----------------
 REDIS_URL = os.getenv("REDIS_URL")
 if REDIS_URL:
@@ -217,6 +183,8 @@ else:
     }
 
 CATALOG_CACHE_SECONDS = int(env("CATALOG_CACHE_SECONDS", str(60 * 60)))
+# Per-process in-memory copy in front of the shared cache
+CATALOG_LOCAL_CACHE_SECONDS = int(env("CATALOG_LOCAL_CACHE_SECONDS", "60"))
 
 # ---------------- LOGGING ----------------
 LOGGING = {
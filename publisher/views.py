@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from django.contrib import messages
 from django.contrib.admin.views.decorators import staff_member_required
+from django.core.paginator import Paginator
 from django.db import transaction
 from django.db.models import Q
 from django.shortcuts import get_object_or_404, redirect, render
@@ -14,6 +15,7 @@ from catalog.models import (
     VideoCluster,
     VideoTriggerMap,
     VideoClusterVideo,
+    VideoLanguage,
 )
 from publisher.forms import (
     BundleTriggerMapForm,
@@ -28,6 +30,16 @@ from publisher.forms import (
     make_video_language_formset,
 )
 
+# List pages render one page of rows instead of the whole table.
+_PAGE_SIZE = 50
+
+# Language rows every video is expected to carry (form display order).
+_LANG_CODES = ("en", "hi", "mr", "te", "ta", "bn", "ml", "kn")
+
+
+def _paginate(request, qs):
+    return Paginator(qs, _PAGE_SIZE).get_page(request.GET.get("page"))
+
 
 @staff_member_required
 def dashboard(request):
@@ -40,10 +52,10 @@ def dashboard(request):
 @staff_member_required
 def therapy_list(request):
     q = (request.GET.get("q") or "").strip()
-    rows = TherapyArea.objects.all().order_by("display_name", "code")
+    rows = TherapyArea.objects.only("code", "display_name", "sort_order", "is_active").order_by("display_name", "code")
     if q:
         rows = rows.filter(Q(code__icontains=q) | Q(display_name__icontains=q))
-    return render(request, "publisher/therapy_list.html", {"rows": rows, "q": q})
+    return render(request, "publisher/therapy_list.html", {"rows": _paginate(request, rows), "q": q})
 
 
 @staff_member_required
@@ -79,10 +91,10 @@ def therapy_edit(request, pk):
 @staff_member_required
 def trigger_cluster_list(request):
     q = (request.GET.get("q") or "").strip()
-    rows = TriggerCluster.objects.all().order_by("display_name", "code")
+    rows = TriggerCluster.objects.only("code", "display_name", "sort_order", "is_active").order_by("display_name", "code")
     if q:
         rows = rows.filter(Q(code__icontains=q) | Q(display_name__icontains=q))
-    return render(request, "publisher/trigger_cluster_list.html", {"rows": rows, "q": q})
+    return render(request, "publisher/trigger_cluster_list.html", {"rows": _paginate(request, rows), "q": q})
 
 
 @staff_member_required
@@ -118,10 +130,21 @@ def trigger_cluster_edit(request, pk):
 @staff_member_required
 def trigger_list(request):
     q = (request.GET.get("q") or "").strip()
-    rows = Trigger.objects.select_related("cluster", "primary_therapy").all().order_by("display_name", "code")
+    rows = (
+        Trigger.objects.select_related("cluster", "primary_therapy")
+        .only(
+            "code",
+            "display_name",
+            "doctor_trigger_label",
+            "is_active",
+            "cluster__display_name",
+            "primary_therapy__display_name",
+        )
+        .order_by("display_name", "code")
+    )
     if q:
         rows = rows.filter(Q(code__icontains=q) | Q(display_name__icontains=q))
-    return render(request, "publisher/trigger_list.html", {"rows": rows, "q": q})
+    return render(request, "publisher/trigger_list.html", {"rows": _paginate(request, rows), "q": q})
 
 
 @staff_member_required
@@ -157,10 +180,10 @@ def trigger_edit(request, pk):
 @staff_member_required
 def video_list(request):
     q = (request.GET.get("q") or "").strip()
-    rows = Video.objects.all().order_by("code")
+    rows = Video.objects.only("code", "is_published", "is_active").order_by("code")
     if q:
         rows = rows.filter(Q(code__icontains=q))
-    return render(request, "publisher/video_list.html", {"rows": rows, "q": q})
+    return render(request, "publisher/video_list.html", {"rows": _paginate(request, rows), "q": q})
 
 
 @staff_member_required
@@ -190,7 +213,7 @@ def video_create(request):
             return redirect("publisher:video_list")
     else:
         form = VideoForm()
-        initial = [{"language_code": code} for code in ("en", "hi", "mr", "te", "ta", "bn", "ml", "kn")]
+        initial = [{"language_code": code} for code in _LANG_CODES]
         formset = FormSet(initial=initial)
 
     return render(request, "publisher/video_form.html", {"form": form, "formset": formset, "object": None})
@@ -198,10 +221,15 @@ def video_create(request):
 
 @staff_member_required
 def video_edit(request, pk):
-    video = get_object_or_404(Video, pk=pk)
-
-    for code in ("en", "hi", "mr", "te", "ta", "bn", "ml", "kn"):
-        video.languages.get_or_create(language_code=code, defaults={"title": "", "youtube_url": ""})
+    video = get_object_or_404(Video.objects.prefetch_related("languages"), pk=pk)
+
+    existing_codes = {vl.language_code for vl in video.languages.all()}
+    missing = [code for code in _LANG_CODES if code not in existing_codes]
+    if missing:
+        VideoLanguage.objects.bulk_create(
+            [VideoLanguage(video=video, language_code=code, title="", youtube_url="") for code in missing],
+            ignore_conflicts=True,
+        )
 
     FormSet = make_video_language_formset(extra=0)
 
@@ -245,10 +273,14 @@ def video_edit(request, pk):
 @staff_member_required
 def cluster_list(request):
     q = (request.GET.get("q") or "").strip()
-    rows = VideoCluster.objects.select_related("trigger").all().order_by("display_name", "code")
+    rows = (
+        VideoCluster.objects.select_related("trigger")
+        .only("code", "display_name", "is_published", "is_active", "trigger__display_name")
+        .order_by("display_name", "code")
+    )
     if q:
         rows = rows.filter(Q(code__icontains=q) | Q(display_name__icontains=q))
-    return render(request, "publisher/cluster_list.html", {"rows": rows, "q": q})
+    return render(request, "publisher/cluster_list.html", {"rows": _paginate(request, rows), "q": q})
 
 
 @staff_member_required
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import json
+import threading
+import time
 from collections import defaultdict
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from django.conf import settings
 from django.core.cache import cache
@@ -18,9 +22,120 @@ from catalog.models import (
     VideoClusterVideo,
 )
 
-_CATALOG_CACHE_KEY = "clinic_catalog_payload_v7"
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import zstandard
+except Exception:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+# v8: the cached value is the JSON text of the payload (was a pickled dict in v7),
+# zstd-compressed to bytes when zstandard is installed.
+_CATALOG_CACHE_KEY = "clinic_catalog_payload_v8"
 _CATALOG_CACHE_SECONDS = 60 * 60  # 1 hour
 
+# Per-process copy of the decoded payload in front of the Django cache: (stored_at, payload).
+# Other workers only see admin edits once their copy expires (CATALOG_LOCAL_CACHE_SECONDS).
+_LOCAL: Optional[Tuple[float, Dict[str, Any]]] = None
+_LOCAL_LOCK = threading.Lock()
+_LOCAL_TTL = 60
+
+# Only one worker rebuilds after a miss; the others poll the cache for its result.
+_REBUILD_LOCK_KEY = _CATALOG_CACHE_KEY + ":lock"
+_REBUILD_LOCK_SECONDS = 30
+_REBUILD_WAIT_SECONDS = 5.0
+_REBUILD_POLL_SECONDS = 0.1
+
+
+# Fallback encoder when orjson is missing: built once, compact like orjson's output.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return _JSON_ENCODER.encode(payload)
+
+
+def _loads(data: Union[str, bytes]) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _pack(payload: Dict[str, Any]) -> Union[str, bytes]:
+    text = _dumps(payload)
+    if zstandard is None:
+        return text
+    # Compressor/decompressor objects are not thread-safe, so build one per call.
+    return zstandard.ZstdCompressor(level=3).compress(text.encode("utf-8"))
+
+
+def _unpack(cached: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+    # str entries come from a process without zstandard. A compressed entry this
+    # process cannot read is treated as a miss and rebuilt.
+    if isinstance(cached, bytes):
+        if zstandard is None:
+            return None
+        cached = zstandard.ZstdDecompressor().decompress(cached)
+    return _loads(cached)
+
+
+# WhatsApp prefix templates per language; {doctor} is filled in per request.
+_MESSAGE_TEMPLATES: Dict[str, str] = {
+    "en": (
+        "Your doctor {doctor} has sent you the following video/videos. "
+        "It is very important that you view them and follow the instructions, "
+        "as these are for important observations by your doctor. "
+        "Your child's health and wellbeing depend upon following the instructions in the videos."
+    ),
+    "hi": (
+        "आपके डॉक्टर {doctor} ने आपको निम्न वीडियो/वीडियो भेजे हैं। "
+        "कृपया इन्हें ध्यान से देखें और वीडियो में दिए गए निर्देशों का पालन करें, "
+        "क्योंकि ये आपके डॉक्टर के महत्वपूर्ण निरीक्षणों के लिए हैं। "
+        "आपके बच्चे का स्वास्थ्य और भलाई इन वीडियो में दिए गए निर्देशों का पालन करने पर निर्भर है।"
+    ),
+    "mr": (
+        "तुमचे डॉक्टर {doctor} यांनी तुम्हाला खालील व्हिडिओ/व्हिडिओ पाठवले आहेत. "
+        "कृपया ते काळजीपूर्वक पहा आणि व्हिडिओमध्ये दिलेल्या सूचनांचे पालन करा, "
+        "कारण हे तुमच्या डॉक्टरांच्या महत्त्वाच्या निरीक्षणांसाठी आहेत. "
+        "तुमच्या मुलाचे आरोग्य आणि कल्याण व्हिडिओमधील सूचनांचे पालन करण्यावर अवलंबून आहे."
+    ),
+    "te": (
+        "మీ డాక్టర్ {doctor} మీకు క్రింది వీడియో/వీడియోలను పంపించారు. "
+        "దయచేసి వాటిని జాగ్రత్తగా చూడండి మరియు వీడియోలో ఇచ్చిన సూచనలను అనుసరించండి, "
+        "ఎందుకంటే ఇవి మీ డాక్టర్ యొక్క ముఖ్యమైన పరిశీలనల కోసం. "
+        "మీ పిల్లల ఆరోగ్యం మరియు శ్రేయస్సు వీడియోల్లో ఉన్న సూచనలను అనుసరించడంపై ఆధారపడి ఉంటుంది."
+    ),
+    "ta": (
+        "உங்கள் மருத்துவர் {doctor} உங்களுக்கு கீழ்க்கண்ட வீடியோ/வீடியோக்களை அனுப்பியுள்ளார். "
+        "தயவுசெய்து அவற்றை கவனமாகப் பார்த்து, வீடியோவில் கொடுக்கப்பட்ட வழிமுறைகளைப் பின்பற்றுங்கள், "
+        "ஏனெனில் இவை உங்கள் மருத்துவரின் முக்கியமான கண்காணிப்புகளுக்கானவை. "
+        "உங்கள் குழந்தையின் ஆரோக்கியமும் நலனும் இந்த வீடியோக்களில் உள்ள வழிமுறைகளைப் பின்பற்றுவதில் சார்ந்துள்ளது."
+    ),
+    "bn": (
+        "আপনার ডাক্তার {doctor} আপনাকে নিম্নলিখিত ভিডিও/ভিডিওগুলো পাঠিয়েছেন। "
+        "অনুগ্রহ করে সেগুলো মনোযোগ দিয়ে দেখুন এবং ভিডিওতে দেওয়া নির্দেশনা অনুসরণ করুন, "
+        "কারণ এগুলো আপনার ডাক্তারের গুরুত্বপূর্ণ পর্যবেক্ষণের জন্য। "
+        "আপনার সন্তানের স্বাস্থ্য ও কল্যাণ ভিডিওতে দেওয়া নির্দেশনা অনুসরণ করার উপর নির্ভর করে।"
+    ),
+    "ml": (
+        "നിങ്ങളുടെ ഡോക്ടർ {doctor} നിങ്ങള്‍ക്കായി താഴെ പറയുന്ന വീഡിയോ/വീഡിയോകള്‍ അയച്ചിട്ടുണ്ട്. "
+        "ദയവായി അവ ശ്രദ്ധാപൂർവ്വം കാണുകയും വീഡിയോയിലെ നിർദ്ദേശങ്ങൾ പാലിക്കുകയും ചെയ്യുക, "
+        "കാരണം ഇവ നിങ്ങളുടെ ഡോക്ടറുടെ പ്രധാനപ്പെട്ട നിരീക്ഷണങ്ങൾക്കായാണ്. "
+        "നിങ്ങളുടെ കുട്ടിയുടെ ആരോഗ്യവും ക്ഷേമവും വീഡിയോയിലെ നിർദ്ദേശങ്ങൾ പാലിക്കുന്നതിനെ ആശ്രയിച്ചിരിക്കുന്നു."
+    ),
+    "kn": (
+        "ನಿಮ್ಮ ವೈದ್ಯರು {doctor} ಅವರು ನಿಮಗೆ ಕೆಳಗಿನ ವೀಡಿಯೊ/ವೀಡಿಯೊಗಳನ್ನು ಕಳುಹಿಸಿದ್ದಾರೆ. "
+        "ದಯವಿಟ್ಟು ಅವನ್ನು ಗಮನದಿಂದ ನೋಡಿ ಹಾಗೂ ವೀಡಿಯೊಗಳಲ್ಲಿ ನೀಡಿರುವ ಸೂಚನೆಗಳನ್ನು ಅನುಸರಿಸಿ, "
+        "ಏಕೆಂದರೆ ಇವು ನಿಮ್ಮ ವೈದ್ಯರ ಮಹತ್ವದ ಗಮನಿಸಿಕೆಗಳಿಗಾಗಿ. "
+        "ನಿಮ್ಮ ಮಗುವಿನ ಆರೋಗ್ಯ ಮತ್ತು ಕಲ್ಯಾಣವು ವೀಡಿಯೊಗಳ ಸೂಚನೆಗಳನ್ನು ಪಾಲಿಸುವುದರ ಮೇಲೆ ಅವಲಂಬಿತವಾಗಿದೆ."
+    ),
+}
+
 
 def build_whatsapp_message_prefixes(doctor_name: str) -> Dict[str, str]:
     """
@@ -30,61 +145,15 @@ def build_whatsapp_message_prefixes(doctor_name: str) -> Dict[str, str]:
     NOTE: doctor_name is injected per-request in sharing.views.doctor_share.
     """
     doctor = (doctor_name or "").strip() or "your doctor"
+    return dict(_build_prefixes(doctor))
 
-    templates = {
-        "en": (
-            "Your doctor {doctor} has sent you the following video/videos. "
-            "It is very important that you view them and follow the instructions, "
-            "as these are for important observations by your doctor. "
-            "Your child's health and wellbeing depend upon following the instructions in the videos."
-        ),
-        "hi": (
-            "आपके डॉक्टर {doctor} ने आपको निम्न वीडियो/वीडियो भेजे हैं। "
-            "कृपया इन्हें ध्यान से देखें और वीडियो में दिए गए निर्देशों का पालन करें, "
-            "क्योंकि ये आपके डॉक्टर के महत्वपूर्ण निरीक्षणों के लिए हैं। "
-            "आपके बच्चे का स्वास्थ्य और भलाई इन वीडियो में दिए गए निर्देशों का पालन करने पर निर्भर है।"
-        ),
-        "mr": (
-            "तुमचे डॉक्टर {doctor} यांनी तुम्हाला खालील व्हिडिओ/व्हिडिओ पाठवले आहेत. "
-            "कृपया ते काळजीपूर्वक पहा आणि व्हिडिओमध्ये दिलेल्या सूचनांचे पालन करा, "
-            "कारण हे तुमच्या डॉक्टरांच्या महत्त्वाच्या निरीक्षणांसाठी आहेत. "
-            "तुमच्या मुलाचे आरोग्य आणि कल्याण व्हिडिओमधील सूचनांचे पालन करण्यावर अवलंबून आहे."
-        ),
-        "te": (
-            "మీ డాక్టర్ {doctor} మీకు క్రింది వీడియో/వీడియోలను పంపించారు. "
-            "దయచేసి వాటిని జాగ్రత్తగా చూడండి మరియు వీడియోలో ఇచ్చిన సూచనలను అనుసరించండి, "
-            "ఎందుకంటే ఇవి మీ డాక్టర్ యొక్క ముఖ్యమైన పరిశీలనల కోసం. "
-            "మీ పిల్లల ఆరోగ్యం మరియు శ్రేయస్సు వీడియోల్లో ఉన్న సూచనలను అనుసరించడంపై ఆధారపడి ఉంటుంది."
-        ),
-        "ta": (
-            "உங்கள் மருத்துவர் {doctor} உங்களுக்கு கீழ்க்கண்ட வீடியோ/வீடியோக்களை அனுப்பியுள்ளார். "
-            "தயவுசெய்து அவற்றை கவனமாகப் பார்த்து, வீடியோவில் கொடுக்கப்பட்ட வழிமுறைகளைப் பின்பற்றுங்கள், "
-            "ஏனெனில் இவை உங்கள் மருத்துவரின் முக்கியமான கண்காணிப்புகளுக்கானவை. "
-            "உங்கள் குழந்தையின் ஆரோக்கியமும் நலனும் இந்த வீடியோக்களில் உள்ள வழிமுறைகளைப் பின்பற்றுவதில் சார்ந்துள்ளது."
-        ),
-        "bn": (
-            "আপনার ডাক্তার {doctor} আপনাকে নিম্নলিখিত ভিডিও/ভিডিওগুলো পাঠিয়েছেন। "
-            "অনুগ্রহ করে সেগুলো মনোযোগ দিয়ে দেখুন এবং ভিডিওতে দেওয়া নির্দেশনা অনুসরণ করুন, "
-            "কারণ এগুলো আপনার ডাক্তারের গুরুত্বপূর্ণ পর্যবেক্ষণের জন্য। "
-            "আপনার সন্তানের স্বাস্থ্য ও কল্যাণ ভিডিওতে দেওয়া নির্দেশনা অনুসরণ করার উপর নির্ভর করে।"
-        ),
-        "ml": (
-            "നിങ്ങളുടെ ഡോക്ടർ {doctor} നിങ്ങള്‍ക്കായി താഴെ പറയുന്ന വീഡിയോ/വീഡിയോകള്‍ അയച്ചിട്ടുണ്ട്. "
-            "ദയവായി അവ ശ്രദ്ധാപൂർവ്വം കാണുകയും വീഡിയോയിലെ നിർദ്ദേശങ്ങൾ പാലിക്കുകയും ചെയ്യുക, "
-            "കാരണം ഇവ നിങ്ങളുടെ ഡോക്ടറുടെ പ്രധാനപ്പെട്ട നിരീക്ഷണങ്ങൾക്കായാണ്. "
-            "നിങ്ങളുടെ കുട്ടിയുടെ ആരോഗ്യവും ക്ഷേമവും വീഡിയോയിലെ നിർദ്ദേശങ്ങൾ പാലിക്കുന്നതിനെ ആശ്രയിച്ചിരിക്കുന്നു."
-        ),
-        "kn": (
-            "ನಿಮ್ಮ ವೈದ್ಯರು {doctor} ಅವರು ನಿಮಗೆ ಕೆಳಗಿನ ವೀಡಿಯೊ/ವೀಡಿಯೊಗಳನ್ನು ಕಳುಹಿಸಿದ್ದಾರೆ. "
-            "ದಯವಿಟ್ಟು ಅವನ್ನು ಗಮನದಿಂದ ನೋಡಿ ಹಾಗೂ ವೀಡಿಯೊಗಳಲ್ಲಿ ನೀಡಿರುವ ಸೂಚನೆಗಳನ್ನು ಅನುಸರಿಸಿ, "
-            "ಏಕೆಂದರೆ ಇವು ನಿಮ್ಮ ವೈದ್ಯರ ಮಹತ್ವದ ಗಮನಿಸಿಕೆಗಳಿಗಾಗಿ. "
-            "ನಿಮ್ಮ ಮಗುವಿನ ಆರೋಗ್ಯ ಮತ್ತು ಕಲ್ಯಾಣವು ವೀಡಿಯೊಗಳ ಸೂಚನೆಗಳನ್ನು ಪಾಲಿಸುವುದರ ಮೇಲೆ ಅವಲಂಬಿತವಾಗಿದೆ."
-        ),
-    }
 
+@lru_cache(maxsize=128)
+def _build_prefixes(doctor: str) -> Dict[str, str]:
+    # Shared between callers; build_whatsapp_message_prefixes hands out copies.
     out: Dict[str, str] = {}
     for code, _label in LANGUAGES:
-        tmpl = templates.get(code, templates["en"])
+        tmpl = _MESSAGE_TEMPLATES.get(code, _MESSAGE_TEMPLATES["en"])
         out[code] = tmpl.format(doctor=doctor)
     return out
 
@@ -123,8 +192,8 @@ def _build_catalog_payload() -> Dict[str, Any]:
             {
                 "code": tr.code,
                 "display_name": tr.display_name,
-                "therapy_code": tr.primary_therapy.code if getattr(tr, "primary_therapy_id", None) and tr.primary_therapy else "",
-                "cluster_code": tr.cluster.code if getattr(tr, "cluster_id", None) and tr.cluster else "",
+                "therapy_code": tr.primary_therapy.code,
+                "cluster_code": tr.cluster.code,
                 "doctor_trigger_label": tr.doctor_trigger_label or "",
             }
         )
@@ -153,12 +222,10 @@ def _build_catalog_payload() -> Dict[str, Any]:
     )
 
     bundle_names_by_code: Dict[str, Dict[str, str]] = defaultdict(dict)
-    for row in (
-        VideoClusterLanguage.objects.filter(video_cluster__in=bundles)
-        .select_related("video_cluster")
-        .all()
+    for bcode, lang_code, name in VideoClusterLanguage.objects.filter(video_cluster__in=bundles).values_list(
+        "video_cluster__code", "language_code", "name"
     ):
-        bundle_names_by_code[row.video_cluster.code][row.language_code] = row.name
+        bundle_names_by_code[bcode][lang_code] = name
 
     bundle_trigger_code_by_code: Dict[str, str] = {}
     bundle_therapy_code_by_code: Dict[str, str] = {}
@@ -166,22 +233,18 @@ def _build_catalog_payload() -> Dict[str, Any]:
 
     for b in bundles:
         bundle_display_names_by_code[b.code] = (b.display_name or "").strip() or b.code
-        trig = getattr(b, "trigger", None)
-        bundle_trigger_code_by_code[b.code] = trig.code if trig else ""
-        ta_code = ""
-        if trig and getattr(trig, "primary_therapy_id", None) and trig.primary_therapy:
-            ta_code = trig.primary_therapy.code
-        bundle_therapy_code_by_code[b.code] = ta_code
+        bundle_trigger_code_by_code[b.code] = b.trigger.code
+        bundle_therapy_code_by_code[b.code] = b.trigger.primary_therapy.code
 
     # Bundle -> ordered list of video codes
     bundle_video_codes_by_code: Dict[str, List[str]] = defaultdict(list)
-    vcv_rows = (
+    vcv_rows = list(
         VideoClusterVideo.objects.filter(video_cluster__in=bundles)
-        .select_related("video_cluster", "video")
         .order_by("video_cluster_id", "sort_order", "video__code")
+        .values_list("video_cluster__code", "video__code")
     )
-    for row in vcv_rows:
-        bundle_video_codes_by_code[row.video_cluster.code].append(row.video.code)
+    for bcode, vcode in vcv_rows:
+        bundle_video_codes_by_code[bcode].append(vcode)
 
     # Bundle search text (for keyword search on the share page)
     bundle_search_text_by_code: Dict[str, str] = {}
@@ -195,21 +258,19 @@ def _build_catalog_payload() -> Dict[str, Any]:
                 (b.search_keywords or ""),
             ]
         )
-        trig = getattr(b, "trigger", None)
-        if trig:
-            parts.extend(
-                [
-                    trig.code,
-                    (trig.display_name or ""),
-                    (trig.doctor_trigger_label or ""),
-                    (trig.subtopic_title or ""),
-                    (trig.search_keywords or ""),
-                ]
-            )
-            if getattr(trig, "primary_therapy_id", None):
-                ta = therapy_by_id.get(trig.primary_therapy_id)
-                if ta:
-                    parts.extend([ta.code, (ta.display_name or "")])
+        trig = b.trigger
+        parts.extend(
+            [
+                trig.code,
+                (trig.display_name or ""),
+                (trig.doctor_trigger_label or ""),
+                (trig.subtopic_title or ""),
+                (trig.search_keywords or ""),
+            ]
+        )
+        ta = therapy_by_id.get(trig.primary_therapy_id)
+        if ta:
+            parts.extend([ta.code, (ta.display_name or "")])
         for nm in bundle_names_by_code.get(b.code, {}).values():
             parts.append(nm or "")
 
@@ -235,21 +296,27 @@ def _build_catalog_payload() -> Dict[str, Any]:
     # -----------------------------------------------------------------
     # Videos (+ localized titles + URLs + derived trigger/therapy codes from bundles)
     # -----------------------------------------------------------------
-    videos = list(Video.objects.filter(is_active=True).order_by("code"))
+    videos = list(
+        Video.objects.filter(is_active=True)
+        .order_by("code")
+        .values("id", "code", "description", "search_keywords")
+    )
 
-    vlang_rows = VideoLanguage.objects.filter(video__in=videos).select_related("video")
+    vlang_rows = VideoLanguage.objects.filter(video_id__in=[v["id"] for v in videos]).values_list(
+        "video__code", "language_code", "title", "youtube_url"
+    )
 
     titles_by_video_code: Dict[str, Dict[str, str]] = defaultdict(dict)
     url_by_video_code: Dict[str, Dict[str, str]] = defaultdict(dict)
 
-    for row in vlang_rows:
-        titles_by_video_code[row.video.code][row.language_code] = row.title
-        url_by_video_code[row.video.code][row.language_code] = row.youtube_url
+    for vcode, lang_code, title, url in vlang_rows:
+        titles_by_video_code[vcode][lang_code] = title
+        url_by_video_code[vcode][lang_code] = url
 
     # Video -> bundle codes
     bundle_map: Dict[str, List[str]] = defaultdict(list)
-    for row in vcv_rows:
-        bundle_map[row.video.code].append(row.video_cluster.code)
+    for bcode, vcode in vcv_rows:
+        bundle_map[vcode].append(bcode)
 
     # Video -> derived trigger/therapy codes based on bundle membership
     trigger_codes_by_video: Dict[str, List[str]] = defaultdict(list)
@@ -266,7 +333,7 @@ def _build_catalog_payload() -> Dict[str, Any]:
 
     videos_payload = []
     for v in videos:
-        code = v.code
+        code = v["code"]
         titles = dict(titles_by_video_code.get(code, {}))
         if "en" not in titles:
             titles["en"] = code
@@ -278,8 +345,8 @@ def _build_catalog_payload() -> Dict[str, Any]:
         search_parts.extend([t.lower() for t in titles.values() if t])
         search_parts.extend(
             [
-                (v.description or "").lower(),
-                (v.search_keywords or "").lower(),
+                (v["description"] or "").lower(),
+                (v["search_keywords"] or "").lower(),
             ]
         )
 
@@ -319,14 +386,77 @@ def _build_catalog_payload() -> Dict[str, Any]:
     }
 
 
-def get_catalog_json_cached(force_refresh: bool = False) -> Dict[str, Any]:
-    cache_seconds = getattr(settings, "CATALOG_CACHE_SECONDS", _CATALOG_CACHE_SECONDS)
+# Cache backends that live inside one worker process; invalidation in one worker
+# (or in a management command) cannot reach the others.
+_PROCESS_LOCAL_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
 
-    if not force_refresh:
-        cached = cache.get(_CATALOG_CACHE_KEY)
-        if cached:
-            return cached
+def catalog_cache_is_shared() -> bool:
+    backend = settings.CACHES.get("default", {}).get("BACKEND", "")
+    return backend not in _PROCESS_LOCAL_BACKENDS
 
-    payload = _build_catalog_payload()
-    cache.set(_CATALOG_CACHE_KEY, payload, cache_seconds)
+
+def clear_local_catalog_cache() -> None:
+    global _LOCAL
+    with _LOCAL_LOCK:
+        _LOCAL = None
+
+
+def _set_local(payload: Dict[str, Any]) -> None:
+    global _LOCAL
+    with _LOCAL_LOCK:
+        _LOCAL = (time.monotonic(), payload)
+
+
+def _get_shared_payload() -> Optional[Dict[str, Any]]:
+    cached = cache.get(_CATALOG_CACHE_KEY)
+    if not cached:
+        return None
+    payload = _unpack(cached)
+    if payload is not None:
+        _set_local(payload)
+    return payload
+
+
+def get_catalog_json_cached(force_refresh: bool = False) -> Dict[str, Any]:
+    """
+    Catalog payload, served from this process's memory, then the Django cache, then the DB.
+
+    The returned dict is shared between requests: copy it before changing it.
+    """
+    cache_seconds = getattr(settings, "CATALOG_CACHE_SECONDS", _CATALOG_CACHE_SECONDS)
+    local_ttl = getattr(settings, "CATALOG_LOCAL_CACHE_SECONDS", _LOCAL_TTL)
+
+    locked = False
+    if force_refresh:
+        clear_local_catalog_cache()
+    else:
+        local = _LOCAL
+        if local is not None and time.monotonic() - local[0] < local_ttl:
+            return local[1]
+
+        payload = _get_shared_payload()
+        if payload is not None:
+            return payload
+
+        locked = cache.add(_REBUILD_LOCK_KEY, "1", _REBUILD_LOCK_SECONDS)
+        if not locked:
+            deadline = time.monotonic() + _REBUILD_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                time.sleep(_REBUILD_POLL_SECONDS)
+                payload = _get_shared_payload()
+                if payload is not None:
+                    return payload
+            # The rebuilding worker is slow or died; build our own copy.
+
+    try:
+        payload = _build_catalog_payload()
+        cache.set(_CATALOG_CACHE_KEY, _pack(payload), cache_seconds)
+    finally:
+        if locked:
+            cache.delete(_REBUILD_LOCK_KEY)
+    _set_local(payload)
     return payload
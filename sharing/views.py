@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 
 from django.contrib.auth.decorators import login_required
+from django.db.models import Prefetch
 from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
 from django.shortcuts import get_object_or_404, redirect, render
 
@@ -15,7 +16,7 @@ from catalog.models import (
     VideoClusterLanguage,
 )
 
-from .services import build_whatsapp_message_prefixes, get_catalog_json_cached
+from .services import build_whatsapp_message_prefixes, catalog_cache_is_shared, get_catalog_json_cached
 
 
 def home(request: HttpRequest) -> HttpResponse:
@@ -29,8 +30,9 @@ def doctor_share(request: HttpRequest, doctor_id: str) -> HttpResponse:
     if not doctor or doctor.doctor_id != doctor_id:
         return HttpResponseForbidden("Not allowed")
 
-    # Force refresh once to avoid stale/empty cache during development.
-    catalog_json = get_catalog_json_cached(force_refresh=True)
+    # Catalog edits clear the cache via catalog.signals, but that only reaches every worker
+    # when the cache is shared (REDIS_URL). With a per-process cache, rebuild every time.
+    catalog_json = get_catalog_json_cached(force_refresh=not catalog_cache_is_shared())
 
     # Ensure we are working with a mutable dict
     if isinstance(catalog_json, str):
@@ -124,17 +126,18 @@ def patient_cluster(
     )
     cluster_title = cl_lang.name if cl_lang else cluster.code
 
-    try:
-        videos = cluster.videos.all().order_by("sort_order", "id")
-    except Exception:
-        videos = cluster.videos.all().order_by("id")
+    # Selected language + English fallback for every video, fetched in one extra query
+    lang_prefetch = Prefetch(
+        "languages",
+        queryset=VideoLanguage.objects.filter(language_code__in={lang, "en"}),
+        to_attr="page_languages",
+    )
+    videos = cluster.videos.all().order_by("sort_order", "id").prefetch_related(lang_prefetch)
 
     items = []
     for v in videos:
-        vlang = (
-            VideoLanguage.objects.filter(video=v, language_code=lang).first()
-            or VideoLanguage.objects.filter(video=v, language_code="en").first()
-        )
+        by_lang = {vl.language_code: vl for vl in v.page_languages}
+        vlang = by_lang.get(lang) or by_lang.get("en")
 
         items.append(
             {